@@ -11,11 +11,37 @@ import json
 import os
 from datetime import datetime, timedelta
 import calendar
+import math
 from pathlib import Path
-import threading
 import time
 import sys
 import subprocess
+import atexit
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Shared font tuples
+FONT_SMALL = ('Segoe UI', 8)
+FONT_SMALL_BOLD = ('Segoe UI', 8, 'bold')
+FONT_NORMAL = ('Segoe UI', 9)
+FONT_NORMAL_BOLD = ('Segoe UI', 9, 'bold')
+FONT_NAV = ('Segoe UI', 10)
+FONT_NAV_BOLD = ('Segoe UI', 10, 'bold')
+
+# Optional fast JSON serializer
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+def _dumps(obj):
+    """Serialize to compact JSON bytes"""
+    if _orjson:
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def _loads(data):
+    return _orjson.loads(data) if _orjson else json.loads(data)
 
 # Windows-specific imports
 if sys.platform == 'win32':
@@ -24,12 +50,30 @@ if sys.platform == 'win32':
     import winreg
 
 # ============== DATA MANAGEMENT ==============
+def _rd(year, month, day):
+    """Compact integer day number used as the calendar_events key"""
+    return (year * 12 + month - 1) * 31 + day
+
+# To-do items are stored column-wise: one parallel list per field
+TODO_COLUMNS = ('text', 'done', 'priority', 'created')
+
 class DataManager:
-    def __init__(self):
+    SAVE_DELAY_MS = 500
+    COMPACT_AFTER_DELTAS = 100
+    
+    def __init__(self, root=None):
+        self.root = root
         self.data_dir = Path.home() / '.desktop_widgets'
         self.data_dir.mkdir(exist_ok=True)
         self.data_file = self.data_dir / 'widget_data.json'
+        # Small edits are appended here and folded into data_file on the next full save
+        self.delta_file = self.data_dir / 'deltas.jsonl'
+        self._dirty = False
+        self._save_after_id = None
+        self._batch = False
+        self._delta_count = 0
         self.load_data()
+        atexit.register(self.compact)
     
     def load_data(self):
         default_data = {
@@ -59,7 +103,7 @@ class DataManager:
                 'pomodoro': True
             },
             'calendar_events': {},
-            'todo_items': [],
+            'todo_items': {column: [] for column in TODO_COLUMNS},
             'day_plans': {},
             'weekly_plans': {},
             'monthly_plans': {},
@@ -75,8 +119,8 @@ class DataManager:
         
         if self.data_file.exists():
             try:
-                with open(self.data_file, 'r') as f:
-                    saved_data = json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    saved_data = _loads(f.read())
                     for key in default_data:
                         if key not in saved_data:
                             saved_data[key] = default_data[key]
@@ -85,18 +129,173 @@ class DataManager:
                 self.data = default_data
         else:
             self.data = default_data
+        # Migrate first so replayed deltas hit the in-memory key types (int slots)
+        self.migrate_data()
+        self.replay_deltas()
         self.save_data()
     
+    def replay_deltas(self):
+        if not self.delta_file.exists():
+            return
+        with open(self.delta_file, 'rb') as f:
+            for line in f:
+                self._delta_count += 1
+                try:
+                    delta = _loads(line)
+                except ValueError:
+                    # A line cut short by a crash mid-append
+                    continue
+                self._apply_delta(delta['k'], delta['p'], delta['v'])
+    
+    def migrate_data(self):
+        """Convert data saved by older versions, and JSON string keys, to the in-memory format"""
+        events = {}
+        for key, day_events in self.data['calendar_events'].items():
+            if isinstance(key, str) and '-' in key:
+                # Legacy 'YYYY-MM-DD' key
+                key = _rd(*map(int, key.split('-')))
+            events.setdefault(int(key), []).extend(day_events)
+        self.data['calendar_events'] = events
+        
+        todo = self.data['todo_items']
+        if isinstance(todo, list):
+            # Legacy list of task dicts
+            self.data['todo_items'] = {
+                'text': [task['text'] for task in todo],
+                'done': [task.get('done', False) for task in todo],
+                'priority': [task.get('priority', 'medium') for task in todo],
+                'created': [task.get('created', '') for task in todo]
+            }
+        
+        # Hour and weekday slots are int keys in memory
+        for key in ('day_plans', 'weekly_plans'):
+            plans = self.data[key]
+            for period, slots in plans.items():
+                plans[period] = {int(slot): text for slot, text in slots.items()}
+    
     def save_data(self):
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+        payload = _dumps(self.data)
+        
+        # Write to a temp file and swap it in so a partial write never corrupts the data
+        tmp_file = self.data_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_file, self.data_file)
+        
+        # The snapshot now contains every logged delta
+        if self._delta_count:
+            self.delta_file.unlink(missing_ok=True)
+            self._delta_count = 0
+    
+    def append_deltas(self, changes):
+        """Apply a {(key, path): value} dict (None deletes) and log the entries that differ, in one write"""
+        lines = []
+        for (key, path), value in changes.items():
+            if self._lookup(key, path) != value:
+                self._apply_delta(key, path, value)
+                lines.append(_dumps({'k': key, 'p': list(path), 'v': value}))
+        if not lines:
+            return
+        
+        with open(self.delta_file, 'ab') as f:
+            f.write(b'\n'.join(lines) + b'\n')
+        self._delta_count += len(lines)
+        if self._delta_count >= self.COMPACT_AFTER_DELTAS:
+            self.mark_dirty()
+    
+    def _lookup(self, key, path):
+        target = self.data.get(key, {})
+        for part in path[:-1]:
+            target = target.get(part, {})
+        return target.get(path[-1])
+    
+    def _apply_delta(self, key, path, value):
+        target = self.data.setdefault(key, {})
+        for part in path[:-1]:
+            target = target.setdefault(part, {})
+        if value is None:
+            target.pop(path[-1], None)
+        else:
+            target[path[-1]] = value
+    
+    def compact(self):
+        """Fold logged deltas into the main data file and write pending changes"""
+        if self._delta_count:
+            self._dirty = True
+        self.flush()
     
     def get(self, key, default=None):
         return self.data.get(key, default)
     
     def set(self, key, value):
         self.data[key] = value
-        self.save_data()
+        self.mark_dirty()
+    
+    @contextmanager
+    def mutate(self, key, default=None):
+        """Yield the live value for key to be changed in place; data is marked dirty afterwards"""
+        try:
+            yield self.data.setdefault(key, default)
+        finally:
+            self.mark_dirty()
+    
+    @property
+    def positions(self):
+        return self.data['widget_positions']
+    
+    @property
+    def colors(self):
+        return self.data['widget_colors']
+    
+    @property
+    def sizes(self):
+        return self.data['widget_sizes']
+    
+    @property
+    def visible(self):
+        return self.data['widget_visible']
+    
+    @property
+    def todo_items(self):
+        return self.data['todo_items']
+    
+    def mark_dirty(self):
+        """Flag data as changed and schedule a debounced save"""
+        self._dirty = True
+        if not self._batch:
+            self._schedule_save()
+    
+    def _schedule_save(self):
+        if self.root is None:
+            self.flush()
+            return
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(self.SAVE_DELAY_MS, self.flush)
+    
+    def flush(self):
+        """Write pending changes to disk immediately"""
+        if self._save_after_id is not None:
+            try:
+                self.root.after_cancel(self._save_after_id)
+            except tk.TclError:
+                pass
+            self._save_after_id = None
+        if self._dirty:
+            self._dirty = False
+            self.save_data()
+    
+    @contextmanager
+    def batched(self):
+        """Group several changes into a single save"""
+        previous = self._batch
+        self._batch = True
+        try:
+            yield self
+        finally:
+            self._batch = previous
+            if not previous:
+                self.flush()
 
 # ============== WINDOWS DESKTOP INTEGRATION ==============
 class WindowsDesktopIntegration:
@@ -109,6 +308,11 @@ class WindowsDesktopIntegration:
         self.GWL_EXSTYLE = -20
         self.WS_EX_TOOLWINDOW = 0x00000080
         self.WS_EX_NOACTIVATE = 0x08000000
+        self.EVENT_SYSTEM_FOREGROUND = 0x0003
+        self.WINEVENT_OUTOFCONTEXT = 0x0000
+        self._focus_callbacks = []
+        self._focus_hook = None
+        self._focus_proc = None
     
     def stick_to_desktop(self, hwnd):
         """Make window stay on desktop level"""
@@ -132,7 +336,7 @@ class WindowsDesktopIntegration:
             return False
     
     def keep_at_bottom(self, hwnd):
-        """Continuously keep window at bottom"""
+        """Move window back to the bottom of the z-order"""
         try:
             self.user32.SetWindowPos(
                 hwnd, 
@@ -142,6 +346,33 @@ class WindowsDesktopIntegration:
             )
         except:
             pass
+    
+    def register_focus_callback(self, callback):
+        """Call callback whenever another window comes to the foreground"""
+        self._focus_callbacks.append(callback)
+        if self._focus_hook is not None:
+            return
+        try:
+            WinEventProc = ctypes.WINFUNCTYPE(
+                None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+            )
+            # Keep a reference so the callback isn't garbage collected
+            self._focus_proc = WinEventProc(self._on_foreground)
+            # Out-of-context hook: events arrive through the Tk thread's message loop
+            self._focus_hook = self.user32.SetWinEventHook(
+                self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND,
+                0, self._focus_proc, 0, 0, self.WINEVENT_OUTOFCONTEXT
+            )
+        except Exception as e:
+            print(f"Foreground hook error: {e}")
+    
+    def _on_foreground(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        for callback in self._focus_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Foreground callback error: {e}")
 
 def setup_autostart(enable=True):
     """Setup application to start with Windows"""
@@ -173,6 +404,8 @@ def setup_autostart(enable=True):
 
 # ============== BASE WIDGET CLASS ==============
 class BaseWidget(tk.Toplevel):
+    SAVE_DELAY_MS = 200
+    
     def __init__(self, master, name, title, data_manager, desktop_integration):
         super().__init__(master)
         self.name = name
@@ -183,22 +416,26 @@ class BaseWidget(tk.Toplevel):
         self.is_dragging = False
         self.drag_start_x = 0
         self.drag_start_y = 0
+        self._sr_pending = set()
+        self._pending_saves = {}
+        self._save_after = None
         
         # Window configuration
         self.title(title)
         self.overrideredirect(True)
         self.attributes('-topmost', False)
         
-        # Get saved position and color
-        positions = self.data_manager.get('widget_positions', {})
-        colors = self.data_manager.get('widget_colors', {})
-        sizes = self.data_manager.get('widget_sizes', {})
+        # Keep live references to the saved settings; they are updated in place
+        self._positions = self.data_manager.positions
+        self._colors = self.data_manager.colors
+        self._sizes = self.data_manager.sizes
+        self._visible = self.data_manager.visible
         
-        self.bg_color = colors.get(name, '#E3F2FD')
-        self.is_expanded = sizes.get(name, 'compact') == 'expanded'
+        self.bg_color = self._colors.get(name, '#E3F2FD')
+        self.is_expanded = self._sizes.get(name, 'compact') == 'expanded'
         
         # Set position
-        pos = positions.get(name, None)
+        pos = self._positions.get(name, None)
         if pos:
             self.geometry(f"+{pos['x']}+{pos['y']}")
         else:
@@ -223,11 +460,32 @@ class BaseWidget(tk.Toplevel):
         # Bind events for dragging
         self.bind_drag_events()
         
-        # Schedule desktop sticking
-        self.after(100, self.stick_to_desktop_periodic)
+        # Stick to desktop once created, then only when the window may have been raised
+        self.after(100, self.stick_to_desktop)
+        self.bind('<Map>', self.on_restack)
+        self.bind('<Visibility>', self.on_restack)
+        self.bind('<FocusIn>', lambda e: self.keep_at_bottom())
+        if self.desktop_integration:
+            self.desktop_integration.register_focus_callback(self.keep_at_bottom)
+    
+    def queue_save(self, key, path, text):
+        """Queue an edit to data[key][path]; queued edits are logged together after SAVE_DELAY_MS"""
+        self._pending_saves[(key, tuple(path))] = text or None
+        if self._save_after is None:
+            self._save_after = self.after(self.SAVE_DELAY_MS, self.flush_saves)
+    
+    def flush_saves(self):
+        if self._save_after is not None:
+            self.after_cancel(self._save_after)
+            self._save_after = None
+        if self._pending_saves:
+            pending, self._pending_saves = self._pending_saves, {}
+            self.data_manager.append_deltas(pending)
     
     def create_title_bar(self):
-        title_bar = tk.Frame(self.main_frame, bg=self.darken_color(self.bg_color), height=25)
+        self._dark_bg = dark = self.darken_color(self.bg_color)
+        
+        title_bar = tk.Frame(self.main_frame, bg=dark, height=25)
         title_bar.pack(fill='x', padx=0, pady=0)
         title_bar.pack_propagate(False)
         
@@ -235,14 +493,14 @@ class BaseWidget(tk.Toplevel):
         title_label = tk.Label(
             title_bar, 
             text=self.title_text, 
-            bg=self.darken_color(self.bg_color),
+            bg=dark,
             fg='#333333',
-            font=('Segoe UI', 9, 'bold')
+            font=FONT_NORMAL_BOLD
         )
         title_label.pack(side='left', padx=5)
         
         # Buttons frame
-        btn_frame = tk.Frame(title_bar, bg=self.darken_color(self.bg_color))
+        btn_frame = tk.Frame(title_bar, bg=dark)
         btn_frame.pack(side='right', padx=2)
         
         # Color button
@@ -250,9 +508,9 @@ class BaseWidget(tk.Toplevel):
             btn_frame, 
             text='🎨', 
             command=self.change_color,
-            font=('Segoe UI', 8),
+            font=FONT_SMALL,
             bd=0,
-            bg=self.darken_color(self.bg_color),
+            bg=dark,
             activebackground=self.bg_color,
             cursor='hand2'
         )
@@ -263,9 +521,9 @@ class BaseWidget(tk.Toplevel):
             btn_frame, 
             text='⬇' if not self.is_expanded else '⬆', 
             command=self.toggle_expand,
-            font=('Segoe UI', 8),
+            font=FONT_SMALL,
             bd=0,
-            bg=self.darken_color(self.bg_color),
+            bg=dark,
             activebackground=self.bg_color,
             cursor='hand2'
         )
@@ -276,9 +534,9 @@ class BaseWidget(tk.Toplevel):
             btn_frame, 
             text='✕', 
             command=self.hide_widget,
-            font=('Segoe UI', 8),
+            font=FONT_SMALL,
             bd=0,
-            bg=self.darken_color(self.bg_color),
+            bg=dark,
             activebackground='#ff6b6b',
             cursor='hand2'
         )
@@ -292,7 +550,9 @@ class BaseWidget(tk.Toplevel):
         title_label.bind('<B1-Motion>', self.on_drag)
         title_label.bind('<ButtonRelease-1>', self.stop_drag)
     
-    def darken_color(self, hex_color, factor=0.9):
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def darken_color(hex_color, factor=0.9):
         """Darken a hex color"""
         hex_color = hex_color.lstrip('#')
         rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
@@ -320,70 +580,125 @@ class BaseWidget(tk.Toplevel):
         self.save_position()
     
     def save_position(self):
-        positions = self.data_manager.get('widget_positions', {})
-        positions[self.name] = {'x': self.winfo_x(), 'y': self.winfo_y()}
-        self.data_manager.set('widget_positions', positions)
+        pos = {'x': self.winfo_x(), 'y': self.winfo_y()}
+        # Every click inside the widget ends a "drag"; only save when it actually moved
+        if self._positions.get(self.name) != pos:
+            self._positions[self.name] = pos
+            self.data_manager.mark_dirty()
     
     def change_color(self):
         color = colorchooser.askcolor(initialcolor=self.bg_color, title="Choose Widget Color")
-        if color[1]:
+        # Skip the recolor walk when the dialog is cancelled or the color is unchanged
+        if color[1] and color[1].lower() != self.bg_color.lower():
+            old_color = self.bg_color
             self.bg_color = color[1]
-            self.update_colors()
-            colors = self.data_manager.get('widget_colors', {})
-            colors[self.name] = self.bg_color
-            self.data_manager.set('widget_colors', colors)
+            self.update_colors(old_color)
+            self._colors[self.name] = self.bg_color
+            self.data_manager.mark_dirty()
     
-    def update_colors(self):
+    def update_colors(self, old_color):
         self.configure(bg=self.bg_color)
         self.main_frame.configure(bg=self.bg_color)
         self.content_frame.configure(bg=self.bg_color)
+        self._dark_bg = dark = self.darken_color(self.bg_color)
         for widget in self.main_frame.winfo_children():
             try:
-                widget.configure(bg=self.darken_color(self.bg_color) if isinstance(widget, tk.Frame) else self.bg_color)
+                widget.configure(bg=dark if isinstance(widget, tk.Frame) else self.bg_color)
             except:
                 pass
-        self.update_widget_colors()
-    
-    def update_widget_colors(self):
-        """Override in subclasses to update specific widget colors"""
-        pass
+        self.update_widget_colors(old_color)
+    
+    def update_widget_colors(self, old_color):
+        """Recolor reused content widgets; override to update specific widget colors"""
+        self.recolor_tree(self.content_frame, old_color)
+    
+    def recolor_tree(self, parent, old_color):
+        """Give every descendant of parent still drawn in old_color the current bg_color"""
+        for child in parent.winfo_children():
+            for option in ('bg', 'activebackground'):
+                try:
+                    if child.cget(option) == old_color:
+                        child.configure({option: self.bg_color})
+                except tk.TclError:
+                    pass
+            self.recolor_tree(child, old_color)
     
     def toggle_expand(self):
         self.is_expanded = not self.is_expanded
         self.expand_btn.configure(text='⬆' if self.is_expanded else '⬇')
-        sizes = self.data_manager.get('widget_sizes', {})
-        sizes[self.name] = 'expanded' if self.is_expanded else 'compact'
-        self.data_manager.set('widget_sizes', sizes)
+        self._sizes[self.name] = 'expanded' if self.is_expanded else 'compact'
+        self.data_manager.mark_dirty()
+        self.update_expanded()
+    
+    def update_expanded(self):
+        """Override in subclasses to only rebuild the parts that depend on is_expanded"""
         self.build_content()
     
     def hide_widget(self):
-        visible = self.data_manager.get('widget_visible', {})
-        visible[self.name] = False
-        self.data_manager.set('widget_visible', visible)
+        self._visible[self.name] = False
+        self.data_manager.mark_dirty()
         self.withdraw()
     
     def show_widget(self):
-        visible = self.data_manager.get('widget_visible', {})
-        visible[self.name] = True
-        self.data_manager.set('widget_visible', visible)
+        self._visible[self.name] = True
+        self.data_manager.mark_dirty()
         self.deiconify()
     
-    def stick_to_desktop_periodic(self):
-        """Periodically stick window to desktop"""
+    def get_hwnd(self):
+        return ctypes.windll.user32.GetParent(self.winfo_id())
+    
+    def stick_to_desktop(self):
+        """Stick window to desktop"""
+        if sys.platform == 'win32' and self.desktop_integration:
+            try:
+                self.desktop_integration.stick_to_desktop(self.get_hwnd())
+            except:
+                pass
+    
+    def keep_at_bottom(self):
+        """Push window back below other windows"""
         if sys.platform == 'win32' and self.desktop_integration:
             try:
-                hwnd = ctypes.windll.user32.GetParent(self.winfo_id())
-                self.desktop_integration.keep_at_bottom(hwnd)
+                self.desktop_integration.keep_at_bottom(self.get_hwnd())
             except:
                 pass
-        self.after(500, self.stick_to_desktop_periodic)
+    
+    def on_restack(self, event):
+        # Child widgets report these events too; only react to the window itself
+        if event.widget is self:
+            self.keep_at_bottom()
+    
+    def schedule_scrollregion(self, canvas):
+        """Coalesce <Configure> bursts into one scrollregion update when Tk is idle"""
+        if canvas in self._sr_pending:
+            return
+        self._sr_pending.add(canvas)
+        self.after_idle(self._apply_scrollregion, canvas)
+    
+    def _apply_scrollregion(self, canvas):
+        self._sr_pending.discard(canvas)
+        if canvas.winfo_exists():
+            canvas.configure(scrollregion=canvas.bbox('all'))
     
     def build_content(self):
         """Override in subclasses"""
         pass
 
 # ============== CALENDAR WIDGET ==============
+@lru_cache(maxsize=256)
+def _monthcalendar(year, month):
+    """Cached calendar.monthcalendar, as tuples so the shared result can't be mutated"""
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+@lru_cache(maxsize=256)
+def _month_title(year, month):
+    return datetime(year, month, 1).strftime('%B %Y')
+
 class CalendarWidget(BaseWidget):
+    # Day cell styles
+    _BG_TODAY = '#ff8a80'
+    _BG_EVENT = '#ffeb3b'
+    
     def __init__(self, master, data_manager, desktop_integration):
         super().__init__(master, 'calendar', '📅 Calendar', data_manager, desktop_integration)
     
@@ -401,21 +716,21 @@ class CalendarWidget(BaseWidget):
         
         prev_btn = tk.Button(
             nav_frame, text='◀', command=self.prev_month,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         prev_btn.pack(side='left')
         
         self.month_label = tk.Label(
             nav_frame, 
-            text=self.current_date.strftime('%B %Y'),
-            font=('Segoe UI', 10, 'bold'),
+            text=_month_title(self.current_date.year, self.current_date.month),
+            font=FONT_NAV_BOLD,
             bg=self.bg_color
         )
         self.month_label.pack(side='left', expand=True)
         
         next_btn = tk.Button(
             nav_frame, text='▶', command=self.next_month,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         next_btn.pack(side='right')
         
@@ -426,46 +741,66 @@ class CalendarWidget(BaseWidget):
         days = ['Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su']
         for day in days:
             lbl = tk.Label(
-                days_frame, text=day, font=('Segoe UI', 8, 'bold'),
+                days_frame, text=day, font=FONT_SMALL_BOLD,
                 width=4, bg=self.bg_color, fg='#555'
             )
             lbl.pack(side='left', padx=1)
         
-        # Calendar grid
+        # Calendar grid: 6 weeks x 7 day cells, created once and reconfigured on navigation
         self.calendar_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         self.calendar_frame.pack(fill='both', expand=True)
         
+        self.week_frames = []
+        self.day_cells = {}
+        for r in range(6):
+            week_frame = tk.Frame(self.calendar_frame, bg=self.bg_color)
+            self.week_frames.append(week_frame)
+            for c in range(7):
+                lbl = tk.Label(week_frame, text='', width=4, bg=self.bg_color, relief='flat')
+                lbl.pack(side='left', padx=1, pady=1)
+                lbl.day = 0
+                lbl.bind('<Button-1>', self.on_day_click)
+                self.day_cells[(r, c)] = lbl
+        
+        self._last_rendered_month = None
         self.update_calendar()
         
         # Event section (expanded mode)
         if self.is_expanded:
             self.build_event_section()
     
+    def update_expanded(self):
+        if self.is_expanded:
+            self.build_event_section()
+        else:
+            self.event_frame.destroy()
+            del self.events_list
+    
     def build_event_section(self):
-        event_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        self.event_frame = event_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         event_frame.pack(fill='x', pady=(10, 0))
         
         tk.Label(
             event_frame, text="📝 Events:", 
-            font=('Segoe UI', 9, 'bold'), bg=self.bg_color
+            font=FONT_NORMAL_BOLD, bg=self.bg_color
         ).pack(anchor='w')
         
         # Event entry
         entry_frame = tk.Frame(event_frame, bg=self.bg_color)
         entry_frame.pack(fill='x', pady=2)
         
-        self.event_entry = tk.Entry(entry_frame, font=('Segoe UI', 9), width=25)
+        self.event_entry = tk.Entry(entry_frame, font=FONT_NORMAL, width=25)
         self.event_entry.pack(side='left', fill='x', expand=True)
         
         add_btn = tk.Button(
             entry_frame, text='+', command=self.add_event,
-            font=('Segoe UI', 9, 'bold'), bd=1, cursor='hand2'
+            font=FONT_NORMAL_BOLD, bd=1, cursor='hand2'
         )
         add_btn.pack(side='right', padx=(5, 0))
         
         # Events list
         self.events_list = tk.Listbox(
-            event_frame, font=('Segoe UI', 8), height=4, 
+            event_frame, font=FONT_SMALL, height=4, 
             selectbackground='#bbdefb'
         )
         self.events_list.pack(fill='x', pady=2)
@@ -473,40 +808,56 @@ class CalendarWidget(BaseWidget):
         
         self.update_events_list()
     
-    def update_calendar(self):
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
-        
+    def update_calendar(self, force=False):
         year = self.current_date.year
         month = self.current_date.month
         
-        cal = calendar.monthcalendar(year, month)
-        events = self.data_manager.get('calendar_events', {})
+        now = datetime.now()
+        today_tuple = (now.year, now.month, now.day)
         
-        for week in cal:
-            week_frame = tk.Frame(self.calendar_frame, bg=self.bg_color)
-            week_frame.pack(fill='x')
+        # Nothing to redraw if the same month was already rendered for today
+        render_key = (year, month, today_tuple)
+        if not force and render_key == self._last_rendered_month:
+            return
+        self._last_rendered_month = render_key
+        
+        cal = _monthcalendar(year, month)
+        events = self.data_manager.get('calendar_events', {})
+        event_rds = {date_key for date_key, day_events in events.items() if day_events}
+        
+        for r, week_frame in enumerate(self.week_frames):
+            # Months span 4-6 weeks; only show the rows this month needs
+            if r >= len(cal):
+                week_frame.pack_forget()
+                continue
+            if not week_frame.winfo_manager():
+                week_frame.pack(fill='x')
             
-            for day in week:
+            for c, day in enumerate(cal[r]):
+                lbl = self.day_cells[(r, c)]
+                lbl.day = day
                 if day == 0:
-                    lbl = tk.Label(week_frame, text='', width=4, bg=self.bg_color)
+                    lbl.config(text='', font='TkDefaultFont', bg=self.bg_color, cursor='')
                 else:
-                    date_key = f"{year}-{month:02d}-{day:02d}"
-                    has_event = date_key in events and len(events[date_key]) > 0
-                    is_today = (day == datetime.now().day and 
-                               month == datetime.now().month and 
-                               year == datetime.now().year)
+                    has_event = _rd(year, month, day) in event_rds
+                    is_today = (year, month, day) == today_tuple
                     
-                    bg = '#ff8a80' if is_today else ('#ffeb3b' if has_event else self.bg_color)
+                    font = FONT_NORMAL_BOLD if is_today else FONT_NORMAL
+                    bg = self._BG_TODAY if is_today else (self._BG_EVENT if has_event else self.bg_color)
                     
-                    lbl = tk.Label(
-                        week_frame, text=str(day), width=4,
-                        font=('Segoe UI', 9, 'bold' if is_today else 'normal'),
-                        bg=bg, cursor='hand2', relief='flat'
-                    )
-                    lbl.bind('<Button-1>', lambda e, d=day: self.select_date(d))
-                
-                lbl.pack(side='left', padx=1, pady=1)
+                    lbl.config(text=str(day), font=font, bg=bg, cursor='hand2')
+    
+    def update_widget_colors(self, old_color):
+        super().update_widget_colors(old_color)
+        self.update_calendar(force=True)
+    
+    def selected_key(self):
+        return _rd(self.selected_date.year, self.selected_date.month, self.selected_date.day)
+    
+    def on_day_click(self, event):
+        # Cells are reused across months; the day they currently show is stored on the label
+        if event.widget.day:
+            self.select_date(event.widget.day)
     
     def select_date(self, day):
         self.selected_date = self.current_date.replace(day=day)
@@ -518,7 +869,7 @@ class CalendarWidget(BaseWidget):
             self.current_date = self.current_date.replace(year=self.current_date.year - 1, month=12)
         else:
             self.current_date = self.current_date.replace(month=self.current_date.month - 1)
-        self.month_label.config(text=self.current_date.strftime('%B %Y'))
+        self.month_label.config(text=_month_title(self.current_date.year, self.current_date.month))
         self.update_calendar()
     
     def next_month(self):
@@ -526,39 +877,37 @@ class CalendarWidget(BaseWidget):
             self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1)
         else:
             self.current_date = self.current_date.replace(month=self.current_date.month + 1)
-        self.month_label.config(text=self.current_date.strftime('%B %Y'))
+        self.month_label.config(text=_month_title(self.current_date.year, self.current_date.month))
         self.update_calendar()
     
     def add_event(self):
         event_text = self.event_entry.get().strip()
         if event_text:
-            date_key = self.selected_date.strftime('%Y-%m-%d')
-            events = self.data_manager.get('calendar_events', {})
-            if date_key not in events:
-                events[date_key] = []
-            events[date_key].append(event_text)
-            self.data_manager.set('calendar_events', events)
+            date_key = self.selected_key()
+            with self.data_manager.mutate('calendar_events', {}) as events:
+                if date_key not in events:
+                    events[date_key] = []
+                events[date_key].append(event_text)
             self.event_entry.delete(0, tk.END)
             self.update_events_list()
-            self.update_calendar()
+            self.update_calendar(force=True)
     
     def delete_event(self, event):
         selection = self.events_list.curselection()
         if selection:
-            date_key = self.selected_date.strftime('%Y-%m-%d')
-            events = self.data_manager.get('calendar_events', {})
-            if date_key in events:
-                del events[date_key][selection[0]]
-                if not events[date_key]:
-                    del events[date_key]
-                self.data_manager.set('calendar_events', events)
+            date_key = self.selected_key()
+            if date_key in self.data_manager.get('calendar_events', {}):
+                with self.data_manager.mutate('calendar_events', {}) as events:
+                    del events[date_key][selection[0]]
+                    if not events[date_key]:
+                        del events[date_key]
                 self.update_events_list()
-                self.update_calendar()
+                self.update_calendar(force=True)
     
     def update_events_list(self):
         if hasattr(self, 'events_list'):
             self.events_list.delete(0, tk.END)
-            date_key = self.selected_date.strftime('%Y-%m-%d')
+            date_key = self.selected_key()
             events = self.data_manager.get('calendar_events', {})
             if date_key in events:
                 for event in events[date_key]:
@@ -566,6 +915,8 @@ class CalendarWidget(BaseWidget):
 
 # ============== TODO WIDGET ==============
 class TodoWidget(BaseWidget):
+    COMPACT_TASK_ROWS = 5
+    
     def __init__(self, master, data_manager, desktop_integration):
         super().__init__(master, 'todo', '✅ To-Do List', data_manager, desktop_integration)
     
@@ -577,47 +928,71 @@ class TodoWidget(BaseWidget):
         entry_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         entry_frame.pack(fill='x', pady=(0, 5))
         
-        self.task_entry = tk.Entry(entry_frame, font=('Segoe UI', 9), width=20)
+        self.task_entry = tk.Entry(entry_frame, font=FONT_NORMAL, width=20)
         self.task_entry.pack(side='left', fill='x', expand=True)
         self.task_entry.bind('<Return>', lambda e: self.add_task())
         
         add_btn = tk.Button(
             entry_frame, text='+', command=self.add_task,
-            font=('Segoe UI', 9, 'bold'), bd=1, cursor='hand2'
+            font=FONT_NORMAL_BOLD, bd=1, cursor='hand2'
         )
         add_btn.pack(side='right', padx=(5, 0))
         
         # Tasks list
-        list_height = 10 if self.is_expanded else 5
+        self.list_frame = None
+        task_count = len(self.data_manager.todo_items['text'])
+        self.build_task_list(self.is_expanded or task_count > self.COMPACT_TASK_ROWS)
         
-        list_frame = tk.Frame(self.content_frame, bg=self.bg_color)
-        list_frame.pack(fill='both', expand=True)
-        
-        self.tasks_canvas = tk.Canvas(list_frame, bg=self.bg_color, highlightthickness=0)
-        scrollbar = tk.Scrollbar(list_frame, orient='vertical', command=self.tasks_canvas.yview)
-        self.tasks_inner_frame = tk.Frame(self.tasks_canvas, bg=self.bg_color)
-        
-        self.tasks_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        scrollbar.pack(side='right', fill='y')
-        self.tasks_canvas.pack(side='left', fill='both', expand=True)
+        # Priority legend (expanded)
+        if self.is_expanded:
+            self.build_legend()
+    
+    def build_task_list(self, scrollable):
+        """Build the task list; the scrolling canvas is only created once it is needed"""
+        if self.list_frame is not None:
+            self.list_frame.destroy()
         
-        self.canvas_window = self.tasks_canvas.create_window((0, 0), window=self.tasks_inner_frame, anchor='nw')
+        self.list_frame = tk.Frame(self.content_frame, bg=self.bg_color)
+        self.list_frame.pack(fill='both', expand=True)
+        self.scrollable = scrollable
         
-        self.tasks_inner_frame.bind('<Configure>', self.on_frame_configure)
-        self.tasks_canvas.bind('<Configure>', self.on_canvas_configure)
+        if scrollable:
+            self.tasks_canvas = tk.Canvas(self.list_frame, bg=self.bg_color, highlightthickness=0)
+            scrollbar = tk.Scrollbar(self.list_frame, orient='vertical', command=self.tasks_canvas.yview)
+            self.tasks_inner_frame = tk.Frame(self.tasks_canvas, bg=self.bg_color)
+            
+            self.tasks_canvas.configure(yscrollcommand=scrollbar.set)
+            
+            scrollbar.pack(side='right', fill='y')
+            self.tasks_canvas.pack(side='left', fill='both', expand=True)
+            
+            self.canvas_window = self.tasks_canvas.create_window((0, 0), window=self.tasks_inner_frame, anchor='nw')
+            
+            self.tasks_inner_frame.bind('<Configure>', self.on_frame_configure)
+            self.tasks_canvas.bind('<Configure>', self.on_canvas_configure)
+        else:
+            # Few tasks in compact mode: rows go straight into a plain frame
+            self.tasks_inner_frame = self.list_frame
         
+        self._row_pool = []
         self.update_tasks()
-        
-        # Priority legend (expanded)
+    
+    def build_legend(self):
+        self.legend = tk.Frame(self.content_frame, bg=self.bg_color)
+        self.legend.pack(fill='x', pady=(5, 0))
+        tk.Label(self.legend, text="🔴 High  🟡 Medium  🟢 Low", 
+                font=FONT_SMALL, bg=self.bg_color).pack()
+    
+    def update_expanded(self):
         if self.is_expanded:
-            legend = tk.Frame(self.content_frame, bg=self.bg_color)
-            legend.pack(fill='x', pady=(5, 0))
-            tk.Label(legend, text="🔴 High  🟡 Medium  🟢 Low", 
-                    font=('Segoe UI', 8), bg=self.bg_color).pack()
+            if not self.scrollable:
+                self.build_task_list(True)
+            self.build_legend()
+        else:
+            self.legend.destroy()
     
     def on_frame_configure(self, event):
-        self.tasks_canvas.configure(scrollregion=self.tasks_canvas.bbox('all'))
+        self.schedule_scrollregion(self.tasks_canvas)
     
     def on_canvas_configure(self, event):
         self.tasks_canvas.itemconfig(self.canvas_window, width=event.width)
@@ -625,85 +1000,118 @@ class TodoWidget(BaseWidget):
     def add_task(self):
         task_text = self.task_entry.get().strip()
         if task_text:
-            tasks = self.data_manager.get('todo_items', [])
-            tasks.append({
-                'text': task_text,
-                'done': False,
-                'priority': 'medium',
-                'created': datetime.now().isoformat()
-            })
-            self.data_manager.set('todo_items', tasks)
+            tasks = self.data_manager.todo_items
+            tasks['text'].append(task_text)
+            tasks['done'].append(False)
+            tasks['priority'].append('medium')
+            tasks['created'].append(datetime.now().isoformat())
+            self.data_manager.mark_dirty()
             self.task_entry.delete(0, tk.END)
             self.update_tasks()
     
+    def create_task_row(self, i):
+        """Create the widgets for one task row; rows are reused across updates"""
+        task_frame = tk.Frame(self.tasks_inner_frame, bg=self.bg_color)
+        
+        # Checkbox
+        var = tk.BooleanVar(value=False)
+        cb = tk.Checkbutton(
+            task_frame, variable=var,
+            command=lambda idx=i, v=var: self.toggle_task(idx, v),
+            bg=self.bg_color, activebackground=self.bg_color
+        )
+        cb.pack(side='left')
+        
+        # Priority indicator
+        priority_lbl = tk.Label(task_frame, bg=self.bg_color, font=FONT_SMALL)
+        priority_lbl.pack(side='left')
+        priority_lbl.row_index = i
+        priority_lbl.bind('<Button-1>', self.on_priority_click)
+        
+        # Task text
+        task_lbl = tk.Label(
+            task_frame, bg=self.bg_color,
+            anchor='w', wraplength=150
+        )
+        task_lbl.pack(side='left', fill='x', expand=True)
+        
+        # Delete button
+        del_btn = tk.Button(
+            task_frame, text='✕', command=lambda idx=i: self.delete_task(idx),
+            font=('Segoe UI', 7), bd=0, bg=self.bg_color, fg='#999',
+            activebackground='#ff6b6b', cursor='hand2'
+        )
+        del_btn.pack(side='right')
+        
+        return {
+            'frame': task_frame, 'var': var, 'cb': cb,
+            'prio_lbl': priority_lbl, 'text_lbl': task_lbl, 'del_btn': del_btn,
+            'state': None
+        }
+    
+    def on_priority_click(self, event):
+        self.cycle_priority(event.widget.row_index)
+    
     def update_tasks(self):
-        for widget in self.tasks_inner_frame.winfo_children():
-            widget.destroy()
+        tasks = self.data_manager.todo_items
+        count = len(tasks['text'])
         
-        tasks = self.data_manager.get('todo_items', [])
+        if not self.scrollable and count > self.COMPACT_TASK_ROWS:
+            self.build_task_list(True)
+            return
         
-        for i, task in enumerate(tasks):
-            task_frame = tk.Frame(self.tasks_inner_frame, bg=self.bg_color)
-            task_frame.pack(fill='x', pady=1)
-            
-            # Checkbox
-            var = tk.BooleanVar(value=task['done'])
-            cb = tk.Checkbutton(
-                task_frame, variable=var,
-                command=lambda idx=i, v=var: self.toggle_task(idx, v),
-                bg=self.bg_color, activebackground=self.bg_color
-            )
-            cb.pack(side='left')
+        while len(self._row_pool) < count:
+            self._row_pool.append(self.create_task_row(len(self._row_pool)))
+        
+        priority_colors = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+        
+        for i, (text, done, priority) in enumerate(zip(tasks['text'], tasks['done'], tasks['priority'])):
+            row = self._row_pool[i]
+            if not row['frame'].winfo_manager():
+                row['frame'].pack(fill='x', pady=1)
             
-            # Priority indicator
-            priority_colors = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
-            priority_lbl = tk.Label(
-                task_frame, text=priority_colors.get(task.get('priority', 'medium'), '🟡'),
-                bg=self.bg_color, font=('Segoe UI', 8)
-            )
-            priority_lbl.pack(side='left')
-            priority_lbl.bind('<Button-1>', lambda e, idx=i: self.cycle_priority(idx))
+            # Only touch the widgets of rows whose task actually changed
+            state = (text, done, priority)
+            if state == row['state']:
+                continue
+            row['state'] = state
             
-            # Task text
-            text_style = 'overstrike' if task['done'] else 'normal'
-            fg_color = '#888' if task['done'] else '#333'
-            task_lbl = tk.Label(
-                task_frame, text=task['text'],
-                font=('Segoe UI', 9, text_style), bg=self.bg_color, fg=fg_color,
-                anchor='w', wraplength=150
-            )
-            task_lbl.pack(side='left', fill='x', expand=True)
+            row['var'].set(done)
+            row['prio_lbl'].config(text=priority_colors.get(priority, '🟡'))
             
-            # Delete button
-            del_btn = tk.Button(
-                task_frame, text='✕', command=lambda idx=i: self.delete_task(idx),
-                font=('Segoe UI', 7), bd=0, bg=self.bg_color, fg='#999',
-                activebackground='#ff6b6b', cursor='hand2'
+            text_style = 'overstrike' if done else 'normal'
+            fg_color = '#888' if done else '#333'
+            row['text_lbl'].config(
+                text=text, font=('Segoe UI', 9, text_style), fg=fg_color
             )
-            del_btn.pack(side='right')
+        
+        # Hide rows left over from deleted tasks
+        for row in self._row_pool[count:]:
+            row['frame'].pack_forget()
     
     def toggle_task(self, index, var):
-        tasks = self.data_manager.get('todo_items', [])
-        if 0 <= index < len(tasks):
-            tasks[index]['done'] = var.get()
-            self.data_manager.set('todo_items', tasks)
+        tasks = self.data_manager.todo_items
+        if 0 <= index < len(tasks['done']):
+            tasks['done'][index] = var.get()
+            self.data_manager.mark_dirty()
             self.update_tasks()
     
     def cycle_priority(self, index):
-        tasks = self.data_manager.get('todo_items', [])
-        if 0 <= index < len(tasks):
+        tasks = self.data_manager.todo_items
+        if 0 <= index < len(tasks['priority']):
             priorities = ['low', 'medium', 'high']
-            current = tasks[index].get('priority', 'medium')
+            current = tasks['priority'][index]
             current_idx = priorities.index(current)
-            tasks[index]['priority'] = priorities[(current_idx + 1) % 3]
-            self.data_manager.set('todo_items', tasks)
+            tasks['priority'][index] = priorities[(current_idx + 1) % 3]
+            self.data_manager.mark_dirty()
             self.update_tasks()
     
     def delete_task(self, index):
-        tasks = self.data_manager.get('todo_items', [])
-        if 0 <= index < len(tasks):
-            del tasks[index]
-            self.data_manager.set('todo_items', tasks)
+        tasks = self.data_manager.todo_items
+        if 0 <= index < len(tasks['text']):
+            for column in tasks.values():
+                del column[index]
+            self.data_manager.mark_dirty()
             self.update_tasks()
 
 # ============== DAY PLANNER WIDGET ==============
@@ -715,7 +1123,7 @@ class DayPlannerWidget(BaseWidget):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         
-        self.current_date = datetime.now()
+        self.set_date(datetime.now())
         
         # Date header
         header = tk.Frame(self.content_frame, bg=self.bg_color)
@@ -723,28 +1131,23 @@ class DayPlannerWidget(BaseWidget):
         
         prev_btn = tk.Button(
             header, text='◀', command=self.prev_day,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         prev_btn.pack(side='left')
         
         self.date_label = tk.Label(
             header, text=self.current_date.strftime('%A, %B %d'),
-            font=('Segoe UI', 10, 'bold'), bg=self.bg_color
+            font=FONT_NAV_BOLD, bg=self.bg_color
         )
         self.date_label.pack(side='left', expand=True)
         
         next_btn = tk.Button(
             header, text='▶', command=self.next_day,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         next_btn.pack(side='right')
         
-        # Time slots
-        if self.is_expanded:
-            hours = range(6, 22)  # 6 AM to 10 PM
-        else:
-            hours = range(8, 18)  # 8 AM to 6 PM (compact)
-        
+        # Time slots: hour rows are built on first use and reused when the day changes
         slots_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         slots_frame.pack(fill='both', expand=True)
         
@@ -758,91 +1161,130 @@ class DayPlannerWidget(BaseWidget):
         
         canvas_window = canvas.create_window((0, 0), window=inner_frame, anchor='nw')
         
+        self.slots_inner_frame = inner_frame
+        self.hour_rows = {}
+        self.time_entries = {}
+        
+        inner_frame.bind('<Configure>', lambda e: self.schedule_scrollregion(canvas))
+        
+        self.show_hours()
+    
+    def create_hour_row(self, hour, current_plans):
+        row = tk.Frame(self.slots_inner_frame, bg=self.bg_color)
+        
+        time_lbl = tk.Label(
+            row, text=f"{hour:02d}:00",
+            font=FONT_SMALL, bg=self.bg_color, width=5
+        )
+        time_lbl.pack(side='left')
+        
+        entry = tk.Entry(row, font=FONT_SMALL, width=20)
+        entry.pack(side='left', fill='x', expand=True, padx=2)
+        entry.insert(0, current_plans.get(hour, ''))
+        entry.hour = hour
+        entry.bind('<FocusOut>', self.on_entry_done)
+        entry.bind('<Return>', self.on_entry_done)
+        
+        self.hour_rows[hour] = row
+        self.time_entries[hour] = entry
+    
+    def on_entry_done(self, event):
+        self.save_plan(event.widget.hour)
+    
+    def set_date(self, date):
+        self.current_date = date
+        self._date_key = date.strftime('%Y-%m-%d')
+    
+    def get_current_plans(self):
         day_plans = self.data_manager.get('day_plans', {})
-        date_key = self.current_date.strftime('%Y-%m-%d')
-        current_plans = day_plans.get(date_key, {})
+        return day_plans.get(self._date_key, {})
+    
+    def show_hours(self):
+        if self.is_expanded:
+            hours = range(6, 22)  # 6 AM to 10 PM
+        else:
+            hours = range(8, 18)  # 8 AM to 6 PM (compact)
         
-        self.time_entries = {}
+        # Rows are only created the first time their hour is shown
+        missing = [hour for hour in hours if hour not in self.hour_rows]
+        if missing:
+            current_plans = self.get_current_plans()
+            for hour in missing:
+                self.create_hour_row(hour, current_plans)
         
+        # Re-pack in hour order so rows shown again keep their place
+        for row in self.hour_rows.values():
+            row.pack_forget()
         for hour in hours:
-            row = tk.Frame(inner_frame, bg=self.bg_color)
-            row.pack(fill='x', pady=1)
-            
-            time_lbl = tk.Label(
-                row, text=f"{hour:02d}:00",
-                font=('Segoe UI', 8), bg=self.bg_color, width=5
-            )
-            time_lbl.pack(side='left')
-            
-            entry = tk.Entry(row, font=('Segoe UI', 8), width=20)
-            entry.pack(side='left', fill='x', expand=True, padx=2)
-            entry.insert(0, current_plans.get(str(hour), ''))
-            entry.bind('<FocusOut>', lambda e, h=hour: self.save_plan(h))
-            entry.bind('<Return>', lambda e, h=hour: self.save_plan(h))
-            
-            self.time_entries[hour] = entry
-        
-        inner_frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+            self.hour_rows[hour].pack(fill='x', pady=1)
+    
+    def load_plans(self):
+        # Log queued edits first so the reloaded entries include them
+        self.flush_saves()
+        current_plans = self.get_current_plans()
+        for hour, entry in self.time_entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, current_plans.get(hour, ''))
+    
+    def update_expanded(self):
+        self.show_hours()
     
     def prev_day(self):
-        self.current_date -= timedelta(days=1)
+        self.save_all_plans()
+        self.set_date(self.current_date - timedelta(days=1))
         self.date_label.config(text=self.current_date.strftime('%A, %B %d'))
-        self.build_content()
+        self.load_plans()
     
     def next_day(self):
-        self.current_date += timedelta(days=1)
+        self.save_all_plans()
+        self.set_date(self.current_date + timedelta(days=1))
         self.date_label.config(text=self.current_date.strftime('%A, %B %d'))
-        self.build_content()
+        self.load_plans()
+    
+    def save_all_plans(self):
+        """Store every hour entry in one sweep, before the shown day changes"""
+        for hour in self.time_entries:
+            self.save_plan(hour)
     
     def save_plan(self, hour):
-        day_plans = self.data_manager.get('day_plans', {})
-        date_key = self.current_date.strftime('%Y-%m-%d')
-        
-        if date_key not in day_plans:
-            day_plans[date_key] = {}
-        
         if hour in self.time_entries:
             text = self.time_entries[hour].get().strip()
-            if text:
-                day_plans[date_key][str(hour)] = text
-            elif str(hour) in day_plans[date_key]:
-                del day_plans[date_key][str(hour)]
-        
-        self.data_manager.set('day_plans', day_plans)
+            self.queue_save('day_plans', [self._date_key, hour], text)
 
 # ============== WEEKLY PLANNER WIDGET ==============
+_SHORT_DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+def _week_days(week_start):
+    """The seven dates of the week starting at week_start"""
+    return tuple(week_start + timedelta(days=i) for i in range(7))
+
 class WeeklyPlannerWidget(BaseWidget):
     def __init__(self, master, data_manager, desktop_integration):
+        today = datetime.now()
+        self.set_week(today - timedelta(days=today.weekday()))
         super().__init__(master, 'weekly_planner', '📆 Weekly Planner', data_manager, desktop_integration)
     
     def build_content(self):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         
-        today = datetime.now()
-        self.week_start = today - timedelta(days=today.weekday())
-        
         # Week navigation
         nav_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         nav_frame.pack(fill='x', pady=(0, 5))
         
         prev_btn = tk.Button(
             nav_frame, text='◀', command=self.prev_week,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         prev_btn.pack(side='left')
         
-        week_end = self.week_start + timedelta(days=6)
-        self.week_label = tk.Label(
-            nav_frame, 
-            text=f"{self.week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}",
-            font=('Segoe UI', 9, 'bold'), bg=self.bg_color
-        )
+        self.week_label = tk.Label(nav_frame, font=FONT_NORMAL_BOLD, bg=self.bg_color)
         self.week_label.pack(side='left', expand=True)
+        self._update_week_label()
         
         next_btn = tk.Button(
             nav_frame, text='▶', command=self.next_week,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         next_btn.pack(side='right')
         
@@ -850,13 +1292,9 @@ class WeeklyPlannerWidget(BaseWidget):
         self.build_week_grid()
     
     def build_week_grid(self):
-        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        short_days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        
-        weekly_plans = self.data_manager.get('weekly_plans', {})
-        week_key = self.week_start.strftime('%Y-%W')
-        current_plans = weekly_plans.get(week_key, {})
-        
+        """Create the day widgets once; _refresh_week fills them for the shown week"""
+        self.day_frames = {}
+        self.day_headers = {}
         self.day_entries = {}
         
         if self.is_expanded:
@@ -864,113 +1302,143 @@ class WeeklyPlannerWidget(BaseWidget):
             grid_frame = tk.Frame(self.content_frame, bg=self.bg_color)
             grid_frame.pack(fill='both', expand=True)
             
-            for i, (day, short) in enumerate(zip(days, short_days)):
-                day_date = self.week_start + timedelta(days=i)
-                is_today = day_date.date() == datetime.now().date()
-                
-                day_frame = tk.Frame(grid_frame, bg='#ffeb3b' if is_today else self.bg_color, 
-                                    relief='groove', bd=1)
+            for i, _ in enumerate(_SHORT_DAYS):
+                day_frame = tk.Frame(grid_frame, bg=self.bg_color, relief='groove', bd=1)
                 day_frame.pack(fill='x', pady=1)
                 
-                header = tk.Label(
-                    day_frame, text=f"{short} {day_date.day}",
-                    font=('Segoe UI', 8, 'bold'), 
-                    bg='#ffeb3b' if is_today else self.darken_color(self.bg_color)
-                )
+                header = tk.Label(day_frame, font=FONT_SMALL_BOLD)
                 header.pack(fill='x')
                 
-                entry = tk.Text(day_frame, font=('Segoe UI', 8), height=2, width=25, wrap='word')
+                entry = tk.Text(day_frame, font=FONT_SMALL, height=2, width=25, wrap='word')
                 entry.pack(fill='x', padx=2, pady=2)
-                entry.insert('1.0', current_plans.get(str(i), ''))
-                entry.bind('<FocusOut>', lambda e, idx=i: self.save_week_plan(idx))
+                entry.day_index = i
+                entry.bind('<FocusOut>', self.on_entry_focus_out)
                 
+                self.day_frames[i] = day_frame
+                self.day_headers[i] = header
                 self.day_entries[i] = entry
         else:
             # Compact view
-            for i, short in enumerate(short_days):
-                day_date = self.week_start + timedelta(days=i)
-                is_today = day_date.date() == datetime.now().date()
-                
+            for i, _ in enumerate(_SHORT_DAYS):
                 row = tk.Frame(self.content_frame, bg=self.bg_color)
                 row.pack(fill='x', pady=1)
                 
-                day_lbl = tk.Label(
-                    row, text=f"{short} {day_date.day}",
-                    font=('Segoe UI', 8, 'bold' if is_today else 'normal'),
-                    bg='#ffeb3b' if is_today else self.bg_color, width=8
-                )
+                day_lbl = tk.Label(row, width=8)
                 day_lbl.pack(side='left')
                 
-                entry = tk.Entry(row, font=('Segoe UI', 8), width=20)
+                entry = tk.Entry(row, font=FONT_SMALL, width=20)
                 entry.pack(side='left', fill='x', expand=True, padx=2)
-                entry.insert(0, current_plans.get(str(i), ''))
-                entry.bind('<FocusOut>', lambda e, idx=i: self.save_week_plan(idx))
+                entry.day_index = i
+                entry.bind('<FocusOut>', self.on_entry_focus_out)
                 
+                self.day_frames[i] = row
+                self.day_headers[i] = day_lbl
                 self.day_entries[i] = entry
+        
+        self._refresh_week()
     
-    def prev_week(self):
-        self.week_start -= timedelta(weeks=1)
-        week_end = self.week_start + timedelta(days=6)
+    def _refresh_week(self):
+        """Update day headers and entry text in place for self.week_start"""
+        self.flush_saves()
+        weekly_plans = self.data_manager.get('weekly_plans', {})
+        current_plans = weekly_plans.get(self._week_key, {})
+        today_date = datetime.now().date()
+        dark = self._dark_bg
+        
+        for i, short in enumerate(_SHORT_DAYS):
+            day_date = self._week_days[i]
+            is_today = day_date.date() == today_date
+            header = self.day_headers[i]
+            entry = self.day_entries[i]
+            text = current_plans.get(i, '')
+            
+            if self.is_expanded:
+                self.day_frames[i].config(bg='#ffeb3b' if is_today else self.bg_color)
+                header.config(
+                    text=f"{short} {day_date.day}",
+                    bg='#ffeb3b' if is_today else dark
+                )
+                entry.delete('1.0', 'end')
+                entry.insert('1.0', text)
+            else:
+                header.config(
+                    text=f"{short} {day_date.day}",
+                    font=FONT_SMALL_BOLD if is_today else FONT_SMALL,
+                    bg='#ffeb3b' if is_today else self.bg_color
+                )
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+    
+    def set_week(self, week_start):
+        """Move to the week starting at week_start and precompute its dates"""
+        self.week_start = week_start
+        self._week_key = week_start.strftime('%Y-%W')
+        self._week_days = _week_days(week_start)
+    
+    def on_entry_focus_out(self, event):
+        self.save_week_plan(event.widget.day_index)
+    
+    def update_widget_colors(self, old_color):
+        super().update_widget_colors(old_color)
+        # Day headers take their colors from _refresh_week
+        self._refresh_week()
+    
+    def _update_week_label(self):
+        week_end = self._week_days[6]
         self.week_label.config(text=f"{self.week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}")
-        self.build_content()
+    
+    def prev_week(self):
+        for day_index in self.day_entries:
+            self.save_week_plan(day_index)
+        self.set_week(self.week_start - timedelta(weeks=1))
+        self._update_week_label()
+        self._refresh_week()
     
     def next_week(self):
-        self.week_start += timedelta(weeks=1)
-        week_end = self.week_start + timedelta(days=6)
-        self.week_label.config(text=f"{self.week_start.strftime('%b %d')} - {week_end.strftime('%b %d, %Y')}")
-        self.build_content()
+        for day_index in self.day_entries:
+            self.save_week_plan(day_index)
+        self.set_week(self.week_start + timedelta(weeks=1))
+        self._update_week_label()
+        self._refresh_week()
     
     def save_week_plan(self, day_index):
-        weekly_plans = self.data_manager.get('weekly_plans', {})
-        week_key = self.week_start.strftime('%Y-%W')
-        
-        if week_key not in weekly_plans:
-            weekly_plans[week_key] = {}
-        
         if day_index in self.day_entries:
             entry = self.day_entries[day_index]
             if isinstance(entry, tk.Text):
                 text = entry.get('1.0', 'end-1c').strip()
             else:
                 text = entry.get().strip()
-            
-            if text:
-                weekly_plans[week_key][str(day_index)] = text
-            elif str(day_index) in weekly_plans[week_key]:
-                del weekly_plans[week_key][str(day_index)]
-        
-        self.data_manager.set('weekly_plans', weekly_plans)
+            self.queue_save('weekly_plans', [self._week_key, day_index], text)
 
 # ============== MONTHLY PLANNER WIDGET ==============
 class MonthlyPlannerWidget(BaseWidget):
     def __init__(self, master, data_manager, desktop_integration):
+        self.set_month(datetime.now())
         super().__init__(master, 'monthly_planner', '🗓️ Monthly Planner', data_manager, desktop_integration)
     
     def build_content(self):
         for widget in self.content_frame.winfo_children():
             widget.destroy()
         
-        self.current_date = datetime.now()
-        
         # Month navigation
         nav_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         nav_frame.pack(fill='x', pady=(0, 5))
         
         prev_btn = tk.Button(
             nav_frame, text='◀', command=self.prev_month,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         prev_btn.pack(side='left')
         
         self.month_label = tk.Label(
-            nav_frame, text=self.current_date.strftime('%B %Y'),
-            font=('Segoe UI', 10, 'bold'), bg=self.bg_color
+            nav_frame, text=_month_title(self.current_date.year, self.current_date.month),
+            font=FONT_NAV_BOLD, bg=self.bg_color
         )
         self.month_label.pack(side='left', expand=True)
         
         next_btn = tk.Button(
             nav_frame, text='▶', command=self.next_month,
-            font=('Segoe UI', 10), bd=0, bg=self.bg_color, cursor='hand2'
+            font=FONT_NAV, bd=0, bg=self.bg_color, cursor='hand2'
         )
         next_btn.pack(side='right')
         
@@ -978,10 +1446,6 @@ class MonthlyPlannerWidget(BaseWidget):
         self.build_goals_section()
     
     def build_goals_section(self):
-        monthly_plans = self.data_manager.get('monthly_plans', {})
-        month_key = self.current_date.strftime('%Y-%m')
-        current_plans = monthly_plans.get(month_key, {})
-        
         categories = ['🎯 Goals', '📝 Notes', '💡 Ideas'] if self.is_expanded else ['🎯 Goals']
         self.goal_entries = {}
         
@@ -991,56 +1455,80 @@ class MonthlyPlannerWidget(BaseWidget):
             
             tk.Label(
                 cat_frame, text=category,
-                font=('Segoe UI', 9, 'bold'), bg=self.bg_color
+                font=FONT_NORMAL_BOLD, bg=self.bg_color
             ).pack(anchor='w')
             
             height = 4 if self.is_expanded else 2
-            text_widget = tk.Text(cat_frame, font=('Segoe UI', 8), height=height, width=25, wrap='word')
+            text_widget = tk.Text(cat_frame, font=FONT_SMALL, height=height, width=25, wrap='word')
             text_widget.pack(fill='x', pady=2)
-            text_widget.insert('1.0', current_plans.get(category, ''))
-            text_widget.bind('<FocusOut>', lambda e, cat=category: self.save_goals(cat))
+            text_widget.category = category
+            text_widget.bind('<FocusOut>', self.on_entry_focus_out)
             
             self.goal_entries[category] = text_widget
+        
+        self._refresh_month()
+    
+    def on_entry_focus_out(self, event):
+        self.save_goals(event.widget.category)
+    
+    def _refresh_month(self):
+        """Refill the goal text boxes in place for self.current_date"""
+        self.flush_saves()
+        monthly_plans = self.data_manager.get('monthly_plans', {})
+        current_plans = monthly_plans.get(self._month_key, {})
+        
+        for category, text_widget in self.goal_entries.items():
+            text_widget.delete('1.0', 'end')
+            text_widget.insert('1.0', current_plans.get(category, ''))
     
     def prev_month(self):
+        for category in self.goal_entries:
+            self.save_goals(category)
+        # Step back via day 1 so months shorter than today's day number don't overflow
         if self.current_date.month == 1:
-            self.current_date = self.current_date.replace(year=self.current_date.year - 1, month=12)
+            self.set_month(self.current_date.replace(year=self.current_date.year - 1, month=12, day=1))
         else:
-            self.current_date = self.current_date.replace(month=self.current_date.month - 1)
-        self.month_label.config(text=self.current_date.strftime('%B %Y'))
-        self.build_content()
+            self.set_month(self.current_date.replace(month=self.current_date.month - 1, day=1))
+        self.month_label.config(text=_month_title(self.current_date.year, self.current_date.month))
+        self._refresh_month()
     
     def next_month(self):
+        for category in self.goal_entries:
+            self.save_goals(category)
         if self.current_date.month == 12:
-            self.current_date = self.current_date.replace(year=self.current_date.year + 1, month=1)
+            self.set_month(self.current_date.replace(year=self.current_date.year + 1, month=1, day=1))
         else:
-            self.current_date = self.current_date.replace(month=self.current_date.month + 1)
-        self.month_label.config(text=self.current_date.strftime('%B %Y'))
-        self.build_content()
+            self.set_month(self.current_date.replace(month=self.current_date.month + 1, day=1))
+        self.month_label.config(text=_month_title(self.current_date.year, self.current_date.month))
+        self._refresh_month()
+    
+    def set_month(self, date):
+        self.current_date = date
+        self._month_key = date.strftime('%Y-%m')
     
     def save_goals(self, category):
-        monthly_plans = self.data_manager.get('monthly_plans', {})
-        month_key = self.current_date.strftime('%Y-%m')
-        
-        if month_key not in monthly_plans:
-            monthly_plans[month_key] = {}
-        
         if category in self.goal_entries:
             text = self.goal_entries[category].get('1.0', 'end-1c').strip()
-            if text:
-                monthly_plans[month_key][category] = text
-            elif category in monthly_plans[month_key]:
-                del monthly_plans[month_key][category]
-        
-        self.data_manager.set('monthly_plans', monthly_plans)
+            self.queue_save('monthly_plans', [self._month_key, category], text)
 
 # ============== POMODORO WIDGET ==============
+# Timer text for every second up to the 120 minute focus time limit
+_TIME_STRS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(120 * 60 + 1))
+
 class PomodoroWidget(BaseWidget):
     def __init__(self, master, data_manager, desktop_integration):
         self.timer_running = False
         self.is_focus_time = True
         self.remaining_seconds = 0
         self.sessions_completed = 0
+        self._end_time = 0
+        self._last_shown = None
+        self._last_status = None
+        self._last_session = None
+        self._expanded_frames = []
+        self._week_stats = None
+        self._week_stats_day = None
+        self._week_stats_dirty = True
         super().__init__(master, 'pomodoro', '🍅 Pomodoro Timer', data_manager, desktop_integration)
     
     def build_content(self):
@@ -1066,11 +1554,7 @@ class PomodoroWidget(BaseWidget):
         timer_frame = tk.Frame(self.content_frame, bg=self.bg_color)
         timer_frame.pack(fill='x', pady=10)
         
-        self.status_label = tk.Label(
-            timer_frame, text='🎯 Focus Time' if self.is_focus_time else '☕ Break Time',
-            font=('Segoe UI', 10, 'bold'), bg=self.bg_color,
-            fg='#d32f2f' if self.is_focus_time else '#388e3c'
-        )
+        self.status_label = tk.Label(timer_frame, font=FONT_NAV_BOLD, bg=self.bg_color)
         self.status_label.pack()
         
         self.timer_label = tk.Label(
@@ -1078,13 +1562,13 @@ class PomodoroWidget(BaseWidget):
             font=('Consolas', 28, 'bold'), bg=self.bg_color
         )
         self.timer_label.pack()
+        self._last_shown = self.remaining_seconds
         
         # Session counter
-        self.session_label = tk.Label(
-            timer_frame, text=f"Sessions: {self.sessions_completed}/{self.sessions_before_long_break}",
-            font=('Segoe UI', 9), bg=self.bg_color
-        )
+        self.session_label = tk.Label(timer_frame, font=FONT_NORMAL, bg=self.bg_color)
         self.session_label.pack()
+        self._last_status = self._last_session = None
+        self.update_status_labels()
         
         # Control buttons
         btn_frame = tk.Frame(self.content_frame, bg=self.bg_color)
@@ -1092,40 +1576,53 @@ class PomodoroWidget(BaseWidget):
         
         self.start_btn = tk.Button(
             btn_frame, text='▶ Start', command=self.toggle_timer,
-            font=('Segoe UI', 9), cursor='hand2'
+            font=FONT_NORMAL, cursor='hand2'
         )
         self.start_btn.pack(side='left', padx=2)
         
         reset_btn = tk.Button(
             btn_frame, text='↺ Reset', command=self.reset_timer,
-            font=('Segoe UI', 9), cursor='hand2'
+            font=FONT_NORMAL, cursor='hand2'
         )
         reset_btn.pack(side='left', padx=2)
         
         skip_btn = tk.Button(
             btn_frame, text='⏭ Skip', command=self.skip_session,
-            font=('Segoe UI', 9), cursor='hand2'
+            font=FONT_NORMAL, cursor='hand2'
         )
         skip_btn.pack(side='left', padx=2)
         
-        # Expanded features
+        # Expanded features are built on first expand
+        self._expanded_frames = []
         if self.is_expanded:
             self.build_expanded_features()
     
+    def update_expanded(self):
+        """Show or hide the expanded frames, building them on first use"""
+        if not self.is_expanded:
+            for frame in self._expanded_frames:
+                frame.pack_forget()
+        elif not self._expanded_frames:
+            self.build_expanded_features()
+        else:
+            for frame in self._expanded_frames:
+                frame.pack(fill='x', pady=5, padx=2)
+            self.update_progress()
+    
     def build_expanded_features(self):
         # Settings
         settings_frame = tk.LabelFrame(
             self.content_frame, text="⚙️ Settings",
-            font=('Segoe UI', 9, 'bold'), bg=self.bg_color
+            font=FONT_NORMAL_BOLD, bg=self.bg_color
         )
         settings_frame.pack(fill='x', pady=5, padx=2)
         
         # Focus time setting
         focus_row = tk.Frame(settings_frame, bg=self.bg_color)
         focus_row.pack(fill='x', pady=2)
-        tk.Label(focus_row, text="Focus (min):", font=('Segoe UI', 8), bg=self.bg_color).pack(side='left')
+        tk.Label(focus_row, text="Focus (min):", font=FONT_SMALL, bg=self.bg_color).pack(side='left')
         self.focus_spinbox = tk.Spinbox(focus_row, from_=1, to=120, width=5, 
-                                        font=('Segoe UI', 8))
+                                        font=FONT_SMALL)
         self.focus_spinbox.pack(side='right')
         self.focus_spinbox.delete(0, tk.END)
         self.focus_spinbox.insert(0, self.focus_time)
@@ -1133,9 +1630,9 @@ class PomodoroWidget(BaseWidget):
         # Break time setting
         break_row = tk.Frame(settings_frame, bg=self.bg_color)
         break_row.pack(fill='x', pady=2)
-        tk.Label(break_row, text="Break (min):", font=('Segoe UI', 8), bg=self.bg_color).pack(side='left')
+        tk.Label(break_row, text="Break (min):", font=FONT_SMALL, bg=self.bg_color).pack(side='left')
         self.break_spinbox = tk.Spinbox(break_row, from_=1, to=60, width=5,
-                                        font=('Segoe UI', 8))
+                                        font=FONT_SMALL)
         self.break_spinbox.pack(side='right')
         self.break_spinbox.delete(0, tk.END)
         self.break_spinbox.insert(0, self.break_time)
@@ -1143,9 +1640,9 @@ class PomodoroWidget(BaseWidget):
         # Long break setting
         long_break_row = tk.Frame(settings_frame, bg=self.bg_color)
         long_break_row.pack(fill='x', pady=2)
-        tk.Label(long_break_row, text="Long Break (min):", font=('Segoe UI', 8), bg=self.bg_color).pack(side='left')
+        tk.Label(long_break_row, text="Long Break (min):", font=FONT_SMALL, bg=self.bg_color).pack(side='left')
         self.long_break_spinbox = tk.Spinbox(long_break_row, from_=1, to=60, width=5,
-                                             font=('Segoe UI', 8))
+                                             font=FONT_SMALL)
         self.long_break_spinbox.pack(side='right')
         self.long_break_spinbox.delete(0, tk.END)
         self.long_break_spinbox.insert(0, self.long_break_time)
@@ -1153,63 +1650,102 @@ class PomodoroWidget(BaseWidget):
         # Save settings button
         save_btn = tk.Button(
             settings_frame, text="💾 Save Settings", command=self.save_settings,
-            font=('Segoe UI', 8), cursor='hand2'
+            font=FONT_SMALL, cursor='hand2'
         )
         save_btn.pack(pady=5)
         
         # History
         history_frame = tk.LabelFrame(
             self.content_frame, text="📊 Today's Progress",
-            font=('Segoe UI', 9, 'bold'), bg=self.bg_color
+            font=FONT_NORMAL_BOLD, bg=self.bg_color
         )
         history_frame.pack(fill='x', pady=5, padx=2)
         
-        today = datetime.now().strftime('%Y-%m-%d')
-        history = self.data_manager.get('pomodoro_history', {})
-        today_data = history.get(today, {'sessions': 0, 'focus_minutes': 0})
-        
-        tk.Label(
-            history_frame, 
-            text=f"✅ Sessions: {today_data['sessions']}\n⏱️ Focus: {today_data['focus_minutes']} min",
-            font=('Segoe UI', 9), bg=self.bg_color, justify='left'
-        ).pack(anchor='w', padx=5, pady=5)
+        self.today_stats_label = tk.Label(
+            history_frame, font=FONT_NORMAL, bg=self.bg_color, justify='left'
+        )
+        self.today_stats_label.pack(anchor='w', padx=5, pady=5)
         
         # Weekly summary
         week_frame = tk.LabelFrame(
             self.content_frame, text="📈 Week Summary",
-            font=('Segoe UI', 9, 'bold'), bg=self.bg_color
+            font=FONT_NORMAL_BOLD, bg=self.bg_color
         )
         week_frame.pack(fill='x', pady=5, padx=2)
         
+        self.week_stats_label = tk.Label(week_frame, font=FONT_SMALL, bg=self.bg_color)
+        self.week_stats_label.pack(padx=5, pady=5)
+        
+        self._expanded_frames = [settings_frame, history_frame, week_frame]
+        self.update_progress()
+    
+    def update_progress(self):
+        """Refresh the today and week summary labels"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        history = self.data_manager.get('pomodoro_history', {})
+        today_data = history.get(today, {'sessions': 0, 'focus_minutes': 0})
+        self.today_stats_label.config(
+            text=f"✅ Sessions: {today_data['sessions']}\n⏱️ Focus: {today_data['focus_minutes']} min"
+        )
+        
         week_stats = self.get_week_stats()
-        tk.Label(
-            week_frame,
-            text=f"Sessions: {week_stats['sessions']} | Focus: {week_stats['minutes']} min",
-            font=('Segoe UI', 8), bg=self.bg_color
-        ).pack(padx=5, pady=5)
+        self.week_stats_label.config(
+            text=f"Sessions: {week_stats['sessions']} | Focus: {week_stats['minutes']} min"
+        )
     
-    def format_time(self, seconds):
-        minutes = seconds // 60
-        secs = seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
+    @staticmethod
+    def format_time(seconds):
+        if 0 <= seconds < len(_TIME_STRS):
+            return _TIME_STRS[seconds]
+        # Typed-in settings can go past the spinbox range
+        return f"{seconds // 60:02d}:{seconds % 60:02d}"
     
     def toggle_timer(self):
-        self.timer_running = not self.timer_running
-        self.start_btn.config(text='⏸ Pause' if self.timer_running else '▶ Start')
         if self.timer_running:
-            self.run_timer()
+            self.remaining_seconds = self.seconds_left()
+            self.stop_timer()
+        else:
+            self.timer_running = True
+            self.start_btn.config(text='⏸ Pause')
+            # Count down against the monotonic clock so late ticks never lose time
+            self._end_time = time.monotonic() + self.remaining_seconds
+            self.master.add_ticker(self)
     
-    def run_timer(self):
-        if self.timer_running and self.remaining_seconds > 0:
-            self.remaining_seconds -= 1
-            self.timer_label.config(text=self.format_time(self.remaining_seconds))
-            self.after(1000, self.run_timer)
-        elif self.remaining_seconds == 0:
+    def stop_timer(self):
+        self.timer_running = False
+        self.start_btn.config(text='▶ Start')
+        self.master.remove_ticker(self)
+    
+    def seconds_left(self):
+        return max(0, math.ceil(self._end_time - time.monotonic()))
+    
+    def on_tick(self):
+        self.remaining_seconds = self.seconds_left()
+        self.update_timer_label()
+        if self.remaining_seconds == 0:
             self.timer_complete()
     
+    def update_timer_label(self):
+        if self.remaining_seconds != self._last_shown:
+            self._last_shown = self.remaining_seconds
+            self.timer_label.config(text=self.format_time(self.remaining_seconds))
+    
+    def update_status_labels(self):
+        """Reconfigure the status and session labels only when they change"""
+        if self._last_status != self.is_focus_time:
+            self._last_status = self.is_focus_time
+            self.status_label.config(
+                text='🎯 Focus Time' if self.is_focus_time else '☕ Break Time',
+                fg='#d32f2f' if self.is_focus_time else '#388e3c'
+            )
+        
+        session = (self.sessions_completed, self.sessions_before_long_break)
+        if self._last_session != session:
+            self._last_session = session
+            self.session_label.config(text=f"Sessions: {session[0]}/{session[1]}")
+    
     def timer_complete(self):
-        self.timer_running = False
-        self.start_btn.config(text='▶ Start')
+        self.stop_timer()
         
         if self.is_focus_time:
             # Record focus session
@@ -1228,12 +1764,8 @@ class PomodoroWidget(BaseWidget):
             self.is_focus_time = True
             self.remaining_seconds = self.focus_time * 60
         
-        self.status_label.config(
-            text='🎯 Focus Time' if self.is_focus_time else '☕ Break Time',
-            fg='#d32f2f' if self.is_focus_time else '#388e3c'
-        )
-        self.timer_label.config(text=self.format_time(self.remaining_seconds))
-        self.session_label.config(text=f"Sessions: {self.sessions_completed}/{self.sessions_before_long_break}")
+        self.update_status_labels()
+        self.update_timer_label()
         
         # Play notification sound (system bell)
         self.bell()
@@ -1243,16 +1775,13 @@ class PomodoroWidget(BaseWidget):
         )
     
     def reset_timer(self):
-        self.timer_running = False
-        self.start_btn.config(text='▶ Start')
+        self.stop_timer()
         self.is_focus_time = True
         self.remaining_seconds = self.focus_time * 60
-        self.status_label.config(text='🎯 Focus Time', fg='#d32f2f')
-        self.timer_label.config(text=self.format_time(self.remaining_seconds))
+        self.update_status_labels()
+        self.update_timer_label()
     
     def skip_session(self):
-        self.timer_running = False
-        self.start_btn.config(text='▶ Start')
         self.timer_complete()
     
     def save_settings(self):
@@ -1275,7 +1804,7 @@ class PomodoroWidget(BaseWidget):
             
             if not self.timer_running:
                 self.remaining_seconds = self.focus_time * 60
-                self.timer_label.config(text=self.format_time(self.remaining_seconds))
+                self.update_timer_label()
             
             messagebox.showinfo("Settings Saved", "Pomodoro settings updated!")
         except ValueError:
@@ -1283,35 +1812,52 @@ class PomodoroWidget(BaseWidget):
     
     def record_session(self):
         today = datetime.now().strftime('%Y-%m-%d')
-        history = self.data_manager.get('pomodoro_history', {})
-        
-        if today not in history:
-            history[today] = {'sessions': 0, 'focus_minutes': 0}
-        
-        history[today]['sessions'] += 1
-        history[today]['focus_minutes'] += self.focus_time
+        with self.data_manager.mutate('pomodoro_history', {}) as history:
+            if today not in history:
+                history[today] = {'sessions': 0, 'focus_minutes': 0}
+            
+            history[today]['sessions'] += 1
+            history[today]['focus_minutes'] += self.focus_time
+        self._week_stats_dirty = True
         
-        self.data_manager.set('pomodoro_history', history)
+        if self.is_expanded and self._expanded_frames:
+            self.update_progress()
     
     def get_week_stats(self):
-        history = self.data_manager.get('pomodoro_history', {})
         today = datetime.now()
+        if not self._week_stats_dirty and self._week_stats_day == today.date():
+            return self._week_stats
+        
+        history = self.data_manager.get('pomodoro_history', {})
         week_start = today - timedelta(days=today.weekday())
         
+        day_keys = [d.strftime('%Y-%m-%d') for d in _week_days(week_start)]
+        
         total_sessions = 0
         total_minutes = 0
         
-        for i in range(7):
-            day = week_start + timedelta(days=i)
-            day_key = day.strftime('%Y-%m-%d')
-            if day_key in history:
-                total_sessions += history[day_key]['sessions']
-                total_minutes += history[day_key]['focus_minutes']
+        for day_key in day_keys:
+            entry = history.get(day_key)
+            if entry:
+                total_sessions += entry['sessions']
+                total_minutes += entry['focus_minutes']
         
-        return {'sessions': total_sessions, 'minutes': total_minutes}
+        self._week_stats = {'sessions': total_sessions, 'minutes': total_minutes}
+        self._week_stats_day = today.date()
+        self._week_stats_dirty = False
+        return self._week_stats
 
 # ============== SYSTEM TRAY / CONTROL PANEL ==============
 class ControlPanel(tk.Tk):
+    WIDGET_CLASSES = (
+        ('calendar', CalendarWidget),
+        ('todo', TodoWidget),
+        ('day_planner', DayPlannerWidget),
+        ('weekly_planner', WeeklyPlannerWidget),
+        ('monthly_planner', MonthlyPlannerWidget),
+        ('pomodoro', PomodoroWidget),
+    )
+    
     def __init__(self):
         super().__init__()
         
@@ -1320,7 +1866,7 @@ class ControlPanel(tk.Tk):
         self.resizable(False, False)
         
         # Initialize data manager
-        self.data_manager = DataManager()
+        self.data_manager = DataManager(self)
         
         # Initialize desktop integration
         self.desktop_integration = None
@@ -1331,6 +1877,11 @@ class ControlPanel(tk.Tk):
         if self.data_manager.get('autostart', True):
             setup_autostart(True)
         
+        # Shared one-second tick, only scheduled while a widget listens
+        self._tick_widgets = []
+        self._tick_after_id = None
+        self._next_tick = 0
+        
         # Create widgets
         self.widgets = {}
         self.create_control_panel()
@@ -1351,7 +1902,7 @@ class ControlPanel(tk.Tk):
         header.pack(pady=10)
         
         # Widget toggles
-        toggle_frame = tk.LabelFrame(self, text="Show/Hide Widgets", font=('Segoe UI', 10, 'bold'))
+        toggle_frame = tk.LabelFrame(self, text="Show/Hide Widgets", font=FONT_NAV_BOLD)
         toggle_frame.pack(fill='x', padx=10, pady=5)
         
         widget_names = [
@@ -1372,20 +1923,20 @@ class ControlPanel(tk.Tk):
             
             cb = tk.Checkbutton(
                 toggle_frame, text=widget_label, variable=var,
-                font=('Segoe UI', 10),
+                font=FONT_NAV,
                 command=lambda wid=widget_id: self.toggle_widget(wid)
             )
             cb.pack(anchor='w', padx=10, pady=2)
         
         # Settings
-        settings_frame = tk.LabelFrame(self, text="Settings", font=('Segoe UI', 10, 'bold'))
+        settings_frame = tk.LabelFrame(self, text="Settings", font=FONT_NAV_BOLD)
         settings_frame.pack(fill='x', padx=10, pady=5)
         
         # Autostart toggle
         self.autostart_var = tk.BooleanVar(value=self.data_manager.get('autostart', True))
         autostart_cb = tk.Checkbutton(
             settings_frame, text="Start with Windows", variable=self.autostart_var,
-            font=('Segoe UI', 10), command=self.toggle_autostart
+            font=FONT_NAV, command=self.toggle_autostart
         )
         autostart_cb.pack(anchor='w', padx=10, pady=2)
         
@@ -1395,26 +1946,26 @@ class ControlPanel(tk.Tk):
         
         show_all_btn = tk.Button(
             btn_frame, text="Show All Widgets",
-            command=self.show_all_widgets, font=('Segoe UI', 10)
+            command=self.show_all_widgets, font=FONT_NAV
         )
         show_all_btn.pack(fill='x', pady=2)
         
         hide_all_btn = tk.Button(
             btn_frame, text="Hide All Widgets",
-            command=self.hide_all_widgets, font=('Segoe UI', 10)
+            command=self.hide_all_widgets, font=FONT_NAV
         )
         hide_all_btn.pack(fill='x', pady=2)
         
         reset_btn = tk.Button(
             btn_frame, text="Reset Positions",
-            command=self.reset_positions, font=('Segoe UI', 10)
+            command=self.reset_positions, font=FONT_NAV
         )
         reset_btn.pack(fill='x', pady=2)
         
         # Exit button
         exit_btn = tk.Button(
             self, text="Exit Application",
-            command=self.exit_app, font=('Segoe UI', 10), fg='red'
+            command=self.exit_app, font=FONT_NAV, fg='red'
         )
         exit_btn.pack(pady=10)
         
@@ -1446,31 +1997,63 @@ class ControlPanel(tk.Tk):
         self.show_panel_btn.geometry(f"+{x}+{y}")
     
     def create_widgets(self):
-        visible = self.data_manager.get('widget_visible', {})
-        
-        # Create all widgets
-        self.widgets['calendar'] = CalendarWidget(self, self.data_manager, self.desktop_integration)
-        self.widgets['todo'] = TodoWidget(self, self.data_manager, self.desktop_integration)
-        self.widgets['day_planner'] = DayPlannerWidget(self, self.data_manager, self.desktop_integration)
-        self.widgets['weekly_planner'] = WeeklyPlannerWidget(self, self.data_manager, self.desktop_integration)
-        self.widgets['monthly_planner'] = MonthlyPlannerWidget(self, self.data_manager, self.desktop_integration)
-        self.widgets['pomodoro'] = PomodoroWidget(self, self.data_manager, self.desktop_integration)
-        
-        # Set initial visibility
-        for widget_id, widget in self.widgets.items():
-            if not visible.get(widget_id, True):
-                widget.withdraw()
+        """Create the widgets one per idle callback so the control panel shows first"""
+        self.after_idle(self._create_next, iter(self.WIDGET_CLASSES))
+    
+    def _create_next(self, pending):
+        item = next(pending, None)
+        if item is None:
+            return
+        widget_id, widget_class = item
+        widget = widget_class(self, self.data_manager, self.desktop_integration)
+        self.widgets[widget_id] = widget
+        if not self.toggle_vars[widget_id].get():
+            widget.withdraw()
+        self.after_idle(self._create_next, pending)
     
     def toggle_widget(self, widget_id):
         visible = self.toggle_vars[widget_id].get()
-        vis_data = self.data_manager.get('widget_visible', {})
-        vis_data[widget_id] = visible
-        self.data_manager.set('widget_visible', vis_data)
+        self.data_manager.visible[widget_id] = visible
+        self.data_manager.mark_dirty()
         
+        # Widgets not created yet pick up the visibility in _create_next
+        widget = self.widgets.get(widget_id)
+        if widget is None:
+            return
         if visible:
-            self.widgets[widget_id].deiconify()
+            widget.deiconify()
         else:
-            self.widgets[widget_id].withdraw()
+            widget.withdraw()
+    
+    def add_ticker(self, widget):
+        """Call widget.on_tick() once a second until remove_ticker"""
+        if widget in self._tick_widgets:
+            return
+        self._tick_widgets.append(widget)
+        if self._tick_after_id is None:
+            self._next_tick = time.monotonic()
+            self._schedule_tick()
+    
+    def remove_ticker(self, widget):
+        if widget in self._tick_widgets:
+            self._tick_widgets.remove(widget)
+        if not self._tick_widgets and self._tick_after_id is not None:
+            self.after_cancel(self._tick_after_id)
+            self._tick_after_id = None
+    
+    def _schedule_tick(self):
+        # Ticks follow a fixed monotonic grid so late callbacks don't drift
+        now = time.monotonic()
+        self._next_tick += 1
+        if self._next_tick < now:
+            # Skip ticks missed while the machine was busy or asleep
+            self._next_tick += math.ceil(now - self._next_tick)
+        self._tick_after_id = self.after(int((self._next_tick - now) * 1000) + 1, self._tick)
+    
+    def _tick(self):
+        self._schedule_tick()
+        for widget in list(self._tick_widgets):
+            widget.on_tick()
     
     def toggle_autostart(self):
         enabled = self.autostart_var.get()
@@ -1478,24 +2061,29 @@ class ControlPanel(tk.Tk):
         setup_autostart(enabled)
     
     def show_all_widgets(self):
-        for widget_id in self.widgets:
-            self.toggle_vars[widget_id].set(True)
-            self.toggle_widget(widget_id)
+        with self.data_manager.batched():
+            for widget_id in self.toggle_vars:
+                self.toggle_vars[widget_id].set(True)
+                self.toggle_widget(widget_id)
     
     def hide_all_widgets(self):
-        for widget_id in self.widgets:
-            self.toggle_vars[widget_id].set(False)
-            self.toggle_widget(widget_id)
+        with self.data_manager.batched():
+            for widget_id in self.toggle_vars:
+                self.toggle_vars[widget_id].set(False)
+                self.toggle_widget(widget_id)
     
     def reset_positions(self):
-        positions = {}
+        # Update in place: widgets hold references to this dict
+        positions = self.data_manager.positions
+        positions.clear()
         x, y = 100, 100
-        for widget_id, widget in self.widgets.items():
+        for widget_id, _ in self.WIDGET_CLASSES:
             positions[widget_id] = {'x': x, 'y': y}
-            widget.geometry(f"+{x}+{y}")
+            if widget_id in self.widgets:
+                self.widgets[widget_id].geometry(f"+{x}+{y}")
             x += 50
             y += 50
-        self.data_manager.set('widget_positions', positions)
+        self.data_manager.mark_dirty()
     
     def hide_to_tray(self):
         self.withdraw()
@@ -1505,7 +2093,9 @@ class ControlPanel(tk.Tk):
         self.lift()
     
     def exit_app(self):
-        self.data_manager.save_data()
+        for widget in self.widgets.values():
+            widget.flush_saves()
+        self.data_manager.compact()
         self.destroy()
 
 # ============== MAIN ENTRY POINT ==============